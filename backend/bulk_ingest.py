@@ -0,0 +1,204 @@
+"""Bulk ingest an archive of PDF statements into the vector store.
+
+Parses PDFs in a process pool, embeds chunks in large batches and writes them
+with bulk upserts. Progress is checkpointed after every write so an interrupted
+run resumes from the last committed batch.
+
+Stop the API server first: chroma's persistent client is not safe to share
+between processes, so a running server would not see the ingested chunks and
+could overwrite them when it persists its index.
+
+Run from the backend directory:
+    python bulk_ingest.py ../archive --user-id 1
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from langchain.schema import Document
+from config import settings
+from services.pdf_processor import PDFProcessor
+from services.vector_store import VectorStoreService
+
+logger = logging.getLogger(__name__)
+
+# one processor per worker process, created by the pool initializer
+_processor: Optional[PDFProcessor] = None
+
+
+def _init_worker() -> None:
+    global _processor
+    _processor = PDFProcessor(file_path="")
+
+
+def _parse_pdf(file_path: str, user_id: int) -> List[Document]:
+    return _processor.process_pdf(file_path=file_path, user_id=user_id)
+
+
+def _file_fingerprint(file_path: str) -> str:
+    stat = os.stat(file_path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _chunk_ids(user_id: int, file_path: str, count: int) -> List[str]:
+    """Deterministic chunk ids so a resumed run overwrites rather than duplicates"""
+    return [
+        hashlib.sha1(f"{user_id}:{file_path}:{i}".encode()).hexdigest()[:16]
+        for i in range(count)
+    ]
+
+
+class IngestCheckpoint:
+    """Tracks which files have been committed to the vector store, per user"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: Dict[str, str] = {}
+
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self.completed = json.load(f).get("completed", {})
+
+    @staticmethod
+    def _key(user_id: int, file_path: str) -> str:
+        return f"{user_id}:{file_path}"
+
+    def is_done(self, user_id: int, file_path: str) -> bool:
+        return self.completed.get(self._key(user_id, file_path)) == _file_fingerprint(file_path)
+
+    def mark_done(self, user_id: int, file_paths: List[str]) -> None:
+        for file_path in file_paths:
+            self.completed[self._key(user_id, file_path)] = _file_fingerprint(file_path)
+
+        # write to a temp file first so a crash never leaves a truncated checkpoint
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"completed": self.completed}, f)
+        os.replace(tmp_path, self.path)
+
+
+def find_pdfs(directory: str, recursive: bool = True) -> List[str]:
+    paths = Path(directory).rglob("*") if recursive else Path(directory).glob("*")
+    return sorted(
+        str(p.resolve()) for p in paths
+        if p.is_file() and p.suffix.lower() == ".pdf"
+    )
+
+
+def ingest_directory(
+    directory: str,
+    user_id: int = 1,
+    workers: int = None,
+    checkpoint_path: str = None,
+    recursive: bool = True,
+) -> Dict[str, float]:
+    """Ingest every PDF under directory that is not already in the checkpoint"""
+    workers = workers or settings.ingest_workers
+    checkpoint = IngestCheckpoint(checkpoint_path or settings.ingest_checkpoint_path)
+    vector_store = VectorStoreService()
+
+    files = find_pdfs(directory, recursive=recursive)
+    pending = [f for f in files if not checkpoint.is_done(user_id, f)]
+    logger.info(f"Found {len(files)} PDFs, {len(files) - len(pending)} already ingested, {len(pending)} pending")
+
+    stats = {"documents": 0, "chunks": 0, "failed": 0}
+    buffer_docs: List[Document] = []
+    buffer_ids: List[str] = []
+    buffer_files: List[str] = []
+    start = time.time()
+
+    def flush() -> None:
+        vector_store.add_documents_bulk(buffer_docs, buffer_ids, user_id=user_id, sources=buffer_files)
+        checkpoint.mark_done(user_id, buffer_files)
+        stats["documents"] += len(buffer_files)
+        stats["chunks"] += len(buffer_docs)
+        buffer_docs.clear()
+        buffer_ids.clear()
+        buffer_files.clear()
+
+        elapsed = time.time() - start
+        logger.info(
+            f"Committed {stats['documents']}/{len(pending)} docs, {stats['chunks']} chunks "
+            f"({stats['documents'] / elapsed:.2f} docs/sec, {stats['chunks'] / elapsed:.2f} chunks/sec)"
+        )
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        queue = iter(pending)
+        in_flight = {}
+
+        # keep a bounded number of parsed files in memory instead of submitting the whole archive
+        def submit_next() -> None:
+            file_path = next(queue, None)
+            if file_path is not None:
+                in_flight[pool.submit(_parse_pdf, file_path, user_id)] = file_path
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path = in_flight.pop(future)
+                submit_next()
+
+                try:
+                    docs = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to parse {file_path} : {e}")
+                    stats["failed"] += 1
+                    continue
+
+                buffer_docs.extend(docs)
+                buffer_ids.extend(_chunk_ids(user_id, file_path, len(docs)))
+                buffer_files.append(file_path)
+
+            if len(buffer_docs) >= settings.ingest_write_batch_size:
+                flush()
+
+    if buffer_files:
+        flush()
+
+    elapsed = time.time() - start
+    stats["elapsed"] = elapsed
+    stats["docs_per_sec"] = stats["documents"] / elapsed if elapsed else 0.0
+    stats["chunks_per_sec"] = stats["chunks"] / elapsed if elapsed else 0.0
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bulk ingest a directory of PDFs into the vector store",
+        epilog="Stop the API server first: the vector store must not be open in another process.",
+    )
+    parser.add_argument("directory", help="Directory containing PDF files")
+    parser.add_argument("--user-id", type=int, default=1, help="Owner of the ingested documents")
+    parser.add_argument("--workers", type=int, default=settings.ingest_workers, help="Number of parser processes")
+    parser.add_argument("--checkpoint", default=settings.ingest_checkpoint_path, help="Checkpoint file used to resume")
+    parser.add_argument("--no-recursive", action="store_true", help="Only ingest files directly under directory")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.log_level)
+
+    stats = ingest_directory(
+        directory=args.directory,
+        user_id=args.user_id,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        recursive=not args.no_recursive,
+    )
+
+    print(
+        f"Ingested {stats['documents']} docs / {stats['chunks']} chunks in {stats['elapsed']:.1f}s "
+        f"({stats['docs_per_sec']:.2f} docs/sec, {stats['chunks_per_sec']:.2f} chunks/sec), "
+        f"{stats['failed']} failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
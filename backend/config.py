@@ -32,6 +32,17 @@ class Settings(BaseSettings):
     # Retrieval configuration
     retrieval_k: int = int(os.getenv("RETRIEVAL_K", "5"))
     similarity_threshold: float = float(os.getenv("SIMILARITY_THRESHOLD", "0.7"))
+    retrieval_top_documents: int = int(os.getenv("RETRIEVAL_TOP_DOCUMENTS", "5"))
+    retrieval_top_pages: int = int(os.getenv("RETRIEVAL_TOP_PAGES", "20"))
+    
+    # Bulk ingestion configuration
+    ingest_workers: int = int(os.getenv("INGEST_WORKERS", str(os.cpu_count() or 1)))
+    ingest_embed_batch_size: int = int(os.getenv("INGEST_EMBED_BATCH_SIZE", "256"))
+    ingest_write_batch_size: int = int(os.getenv("INGEST_WRITE_BATCH_SIZE", "4096"))
+    ingest_checkpoint_path: str = os.getenv("INGEST_CHECKPOINT_PATH", "./ingest_checkpoint.json")
+    
+    # Vector store snapshot configuration
+    snapshot_batch_size: int = int(os.getenv("SNAPSHOT_BATCH_SIZE", "4096"))
     
     # Server configuration
     host: str = os.getenv("HOST", "0.0.0.0")
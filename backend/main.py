@@ -45,6 +45,7 @@ async def startup_event():
     try:
         app.state.pdf_processor = PDFProcessor("../data/sample.pdf")
         app.state.vector_store = VectorStoreService()
+        app.state.vector_store.backfill_summaries()
         app.state.rag_pipeline = RAGPipeline(
             api_key=settings.openai_api_key,
             vector_store_service=app.state.vector_store
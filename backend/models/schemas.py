@@ -46,4 +46,7 @@ class PDFLoadError(Exception):
     pass
 
 class DBInitError(Exception):
+    pass
+
+class SnapshotError(Exception):
     pass
\ No newline at end of file
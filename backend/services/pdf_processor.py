@@ -51,18 +51,18 @@ class PDFProcessor:
             # - Split each page content into smaller chunks
             all_splits = self.text_splitter.split_documents(pages_content)
             # - Create Document objects with proper metadata
-            print("SPLIT 0 : ", all_splits[0])
+            logger.debug(f"Split {len(pages_content)} pages into {len(all_splits)} chunks")
             return all_splits
             # - Return list of Document objects`
         except Exception as e:
             raise e
         
-    def process_pdf(self, file_path: str) -> List[Document]:
+    def process_pdf(self, file_path: str, user_id: int = 1) -> List[Document]:
         """Process PDF file and return list of Document objects"""
         # TODO: Implement complete PDF processing pipeline
         # 1. Extract text from PDF
         try:
-            raw_docs = self.extract_text_from_pdf(file_path=file_path)
+            raw_docs = self.extract_text_from_pdf(file_path=file_path, user_id=user_id)
             # 2. Split text into chunks
             processed_docs = self.split_into_chunks(raw_docs)
             # 3. Return processed documents
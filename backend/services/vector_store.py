@@ -1,4 +1,5 @@
-from typing import List, Tuple
+from typing import Any, BinaryIO, Dict, List, Tuple
+from collections import defaultdict
 import asyncio
 from langchain.schema import Document
 from langchain.vectorstores import VectorStore
@@ -6,8 +7,15 @@ from config import settings
 import chromadb
 from chromadb import ClientAPI
 from chromadb.config import Settings
-from models.schemas import DBInitError
+from models.schemas import DBInitError, SnapshotError
 from uuid import uuid4
+import hashlib
+import io
+import json
+import tarfile
+import tempfile
+from datetime import datetime
+import numpy as np
 from sentence_transformers import SentenceTransformer
 from models.schemas import DocumentInfo, DocumentsResponse
 import logging
@@ -15,6 +23,14 @@ from utils.scheduler import delete_user_file_later
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SNAPSHOT_FORMAT = "rag-llm-pdf-vector-snapshot"
+SNAPSHOT_VERSION = 1
+
+# uploads expire via delete_user_file_later and are kept out of snapshots, bulk ingests are kept
+RETENTION_EPHEMERAL = "ephemeral"
+RETENTION_PERSISTENT = "persistent"
+
 class VectorStoreService:
     def __init__(self):
         # TODO: Initialize vector store (ChromaDB, FAISS, etc.)
@@ -24,7 +40,10 @@ class VectorStoreService:
             raise DBInitError(f"Failed to initialize ChromaDB: {e}") from e
 
         self.collection = self.db.get_or_create_collection(name="chat_db")
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        # summary level indexes used to narrow chunk search to candidate documents and pages
+        self.documents_collection = self.db.get_or_create_collection(name="chat_db_documents")
+        self.pages_collection = self.db.get_or_create_collection(name="chat_db_pages")
+        self.model = SentenceTransformer(EMBEDDING_MODEL)
 
     # for demo purpose only, use dummy user id
     def add_documents(self, documents: List[Document], user_id: int = 1) -> None:
@@ -34,17 +53,18 @@ class VectorStoreService:
         all_chunks = [doc.page_content for doc in documents]
         
         try:
-            embeddings = self.model.encode(all_chunks)
-            embeddings = embeddings.tolist() # convert numpy arrays to lists
+            vectors = self.model.encode(all_chunks)
+            embeddings = vectors.tolist() # convert numpy arrays to lists
             print(f"Embeddings : {embeddings[0]}\n Type of embedding : {type(embeddings)}")
             document_ids = [uuid4().hex[:8] for _ in range(len(all_chunks))] 
             # - Store documents with embeddings in vector database
             self.collection.add(
                 documents=all_chunks,
                 embeddings=embeddings,
-                metadatas=[{**doc.metadata, "status": "processed"} for doc in documents],
+                metadatas=[self._chunk_metadata(doc, RETENTION_EPHEMERAL) for doc in documents],
                 ids=document_ids,
             )
+            self._index_summaries(documents, vectors, RETENTION_EPHEMERAL)
 
             asyncio.create_task(
                 delete_user_file_later(user_id=user_id, file_path="", document_ids=document_ids, callback=self.delete_documents)
@@ -53,24 +73,224 @@ class VectorStoreService:
         except Exception as e:
             logger.error("Error adding documents to vector db : ", e)
             raise e
-    
+
+    def add_documents_bulk(self, documents: List[Document], ids: List[str], user_id: int, sources: List[str]) -> None:
+        """Embed and upsert a large batch of documents without scheduling expiry.
+
+        Ids are supplied by the caller so that re-running an interrupted ingest
+        overwrites chunks instead of duplicating them. Everything previously
+        stored for the given sources is removed first, so a re-ingested file that
+        now splits into fewer (or no) chunks leaves nothing stale behind.
+        """
+        try:
+            self.delete_sources(user_id=user_id, sources=sources)
+            if not documents:
+                return
+
+            all_chunks = [doc.page_content for doc in documents]
+            vectors = self.model.encode(
+                all_chunks,
+                batch_size=settings.ingest_embed_batch_size,
+                show_progress_bar=False,
+            )
+            embeddings = vectors.tolist()
+            metadatas = [self._chunk_metadata(doc, RETENTION_PERSISTENT) for doc in documents]
+
+            # each upsert is committed as one transaction, keep them large but within chroma's limit
+            step = settings.ingest_write_batch_size
+            for start in range(0, len(all_chunks), step):
+                end = start + step
+                self.collection.upsert(
+                    documents=all_chunks[start:end],
+                    embeddings=embeddings[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                )
+            self._index_summaries(documents, vectors, RETENTION_PERSISTENT)
+        except Exception as e:
+            logger.error(f"Error bulk adding documents to vector db : {e}")
+            raise e
+
+    @staticmethod
+    def _document_id(metadata: Dict[str, Any]) -> str:
+        """Stable id of the source file a chunk came from, unique per user and full path"""
+        source = metadata.get("source") or metadata.get("filename")
+        return hashlib.sha1(f"{metadata.get('user_id')}:{source}".encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _page_key(doc_id: str, page: Any) -> str:
+        return f"{doc_id}:{page}"
+
+    def _chunk_metadata(self, doc: Document, retention: str) -> Dict[str, Any]:
+        doc_id = self._document_id(doc.metadata)
+        return {
+            "retention": retention,
+            **doc.metadata,
+            "status": "processed",
+            "doc_id": doc_id,
+            "page_key": self._page_key(doc_id, doc.metadata.get("page", 0)),
+        }
+
+    def _index_summaries(self, documents: List[Document], vectors: np.ndarray, retention: str) -> None:
+        """Upsert document and page summary embeddings (mean of their chunk embeddings)"""
+        doc_groups: Dict[str, List[int]] = defaultdict(list)
+        page_groups: Dict[Tuple[str, Any], List[int]] = defaultdict(list)
+        for i, doc in enumerate(documents):
+            doc_id = self._document_id(doc.metadata)
+            doc_groups[doc_id].append(i)
+            page_groups[(doc_id, doc.metadata.get("page", 0))].append(i)
+
+        def centroid(indices: List[int]) -> List[float]:
+            mean = vectors[indices].mean(axis=0)
+            norm = np.linalg.norm(mean)
+            return (mean / norm if norm else mean).tolist()
+
+        def summary_metadata(doc_id: str, indices: List[int]) -> Dict[str, Any]:
+            first = documents[indices[0]].metadata
+            return {
+                "user_id": first.get("user_id"),
+                "doc_id": doc_id,
+                "filename": first.get("filename"),
+                "retention": first.get("retention", retention),
+            }
+
+        self.documents_collection.upsert(
+            ids=list(doc_groups),
+            embeddings=[centroid(indices) for indices in doc_groups.values()],
+            documents=[documents[indices[0]].metadata.get("filename") for indices in doc_groups.values()],
+            metadatas=[
+                {**summary_metadata(doc_id, indices), "chunks_count": len(indices)}
+                for doc_id, indices in doc_groups.items()
+            ],
+        )
+
+        page_keys = [self._page_key(doc_id, page) for doc_id, page in page_groups]
+        self.pages_collection.upsert(
+            ids=page_keys,
+            embeddings=[centroid(indices) for indices in page_groups.values()],
+            documents=[
+                f"{documents[indices[0]].metadata.get('filename')}, page {page}"
+                for (_, page), indices in page_groups.items()
+            ],
+            metadatas=[
+                {**summary_metadata(doc_id, indices), "page": page, "page_key": page_key}
+                for ((doc_id, page), indices), page_key in zip(page_groups.items(), page_keys)
+            ],
+        )
+
+    def _delete_summaries(self, doc_ids: List[str]) -> None:
+        if doc_ids:
+            self.documents_collection.delete(where={"doc_id": {"$in": doc_ids}})
+            self.pages_collection.delete(where={"doc_id": {"$in": doc_ids}})
+
+    def backfill_summaries(self) -> int:
+        """Add doc_id/page_key and summaries for chunks stored before hierarchical retrieval.
+
+        Runs once per store: after a successful pass the chunk collection is
+        marked so later startups return immediately, since every chunk written
+        since then already carries a doc_id. Returns the number of chunks backfilled.
+        """
+        if (self.collection.metadata or {}).get("summaries_backfilled"):
+            return 0
+
+        try:
+            missing_ids: List[str] = []
+            batch_size = settings.ingest_write_batch_size
+            for offset in range(0, self.collection.count(), batch_size):
+                batch = self.collection.get(include=["metadatas"], limit=batch_size, offset=offset)
+                missing_ids += [
+                    id_ for id_, meta in zip(batch["ids"], batch["metadatas"])
+                    if "doc_id" not in (meta or {})
+                ]
+
+            doc_ids = set()
+            for start in range(0, len(missing_ids), batch_size):
+                batch = self.collection.get(ids=missing_ids[start:start + batch_size], include=["metadatas"])
+                # only the upload path existed before, so untagged chunks are expiring uploads
+                metadatas = [
+                    self._chunk_metadata(Document(page_content="", metadata=meta or {}), RETENTION_EPHEMERAL)
+                    for meta in batch["metadatas"]
+                ]
+                self.collection.update(ids=batch["ids"], metadatas=metadatas)
+                doc_ids.update(meta["doc_id"] for meta in metadatas)
+
+            # summaries are rebuilt from every chunk of the affected documents
+            doc_ids = list(doc_ids)
+            for start in range(0, len(doc_ids), batch_size):
+                batch = self.collection.get(
+                    where={"doc_id": {"$in": doc_ids[start:start + batch_size]}},
+                    include=["metadatas", "embeddings"],
+                )
+                documents = [Document(page_content="", metadata=meta) for meta in batch["metadatas"]]
+                self._index_summaries(documents, np.asarray(batch["embeddings"], dtype=np.float32), RETENTION_EPHEMERAL)
+
+            self.collection.modify(metadata={**(self.collection.metadata or {}), "summaries_backfilled": 1})
+            if missing_ids:
+                logger.info(f"Backfilled summaries for {len(missing_ids)} chunks in {len(doc_ids)} documents")
+            return len(missing_ids)
+        except Exception as e:
+            logger.error(f"Error backfilling summaries : {e}")
+            raise e
+
+    @staticmethod
+    def _nearest(query_embedding: np.ndarray, embeddings: List[List[float]], n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact top-n by squared L2, the same metric the chroma collections use"""
+        if not len(embeddings):
+            return np.array([], dtype=int), np.array([], dtype=np.float32)
+
+        distances = ((np.asarray(embeddings, dtype=np.float32) - query_embedding) ** 2).sum(axis=1)
+        order = np.argsort(distances)[:n]
+        return order, distances[order]
+
+    def _candidate_page_keys(self, user_id, query_embedding: np.ndarray) -> List[str]:
+        """Narrow the search to the best matching pages of the best matching documents.
+
+        Summaries are fetched by metadata filter and ranked exactly, so the cost
+        depends on the user's documents and the candidates' pages only.
+        """
+        docs = self.documents_collection.get(where={"user_id": user_id}, include=["metadatas", "embeddings"])
+        order, _ = self._nearest(query_embedding, docs["embeddings"], settings.retrieval_top_documents)
+        doc_ids = [docs["metadatas"][i]["doc_id"] for i in order]
+        if not doc_ids:
+            return []
+
+        pages = self.pages_collection.get(where={"doc_id": {"$in": doc_ids}}, include=["metadatas", "embeddings"])
+        order, _ = self._nearest(query_embedding, pages["embeddings"], settings.retrieval_top_pages)
+        return [pages["metadatas"][i]["page_key"] for i in order]
+
     def similarity_search(self, user_id, query: str, k: int = None) -> List[Tuple[Document, float]]:
         try:
             """Search for similar documents"""
             # TODO: Implement similarity search
             # - Generate embedding for query
-            # - Search for similar documents in vector store
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=k,
-                where={"user_id": user_id}
-            )
-
-            documents = [
-                Document(page_content=doc, metadata=meta)
-                for doc, meta in zip(results["documents"][0], results["metadatas"][0])
-            ]
-            scores = results["distances"][0]
+            query_embedding = self.model.encode([query])[0]
+            k = k or settings.retrieval_k
+            # - Search for similar documents in vector store. With summaries, only the chunks of
+            #   the candidate pages are fetched and ranked, instead of a filtered walk of the
+            #   whole chunk index
+            page_keys = self._candidate_page_keys(user_id, query_embedding)
+            if page_keys:
+                candidates = self.collection.get(
+                    where={"$and": [{"user_id": user_id}, {"page_key": {"$in": page_keys}}]},
+                    include=["embeddings", "documents", "metadatas"],
+                )
+                order, distances = self._nearest(query_embedding, candidates["embeddings"], k)
+                documents = [
+                    Document(page_content=candidates["documents"][i], metadata=candidates["metadatas"][i])
+                    for i in order
+                ]
+                scores = distances.tolist()
+            else:
+                results = self.collection.query(
+                    query_embeddings=[query_embedding.tolist()],
+                    n_results=k,
+                    where={"user_id": user_id}
+                )
+                documents = [
+                    Document(page_content=doc, metadata=meta)
+                    for doc, meta in zip(results["documents"][0], results["metadatas"][0])
+                ]
+                scores = results["distances"][0]
 
             # - Return documents with similarity scores
             return list(zip(documents, scores))
@@ -83,14 +303,36 @@ class VectorStoreService:
         # TODO: Implement document deletion
         try:
             if document_ids:
+                affected = self.collection.get(ids=document_ids, include=["metadatas"])
                 self.collection.delete(ids=document_ids)
+
+                # summaries are shared by every chunk of a source, only drop them once none remain
+                doc_ids = {meta.get("doc_id") for meta in affected["metadatas"] if meta and meta.get("doc_id")}
+                orphaned = [
+                    doc_id for doc_id in doc_ids
+                    if not self.collection.get(where={"doc_id": doc_id}, limit=1, include=["metadatas"])["ids"]
+                ]
+                self._delete_summaries(orphaned)
             elif user_id is not None:
-                self.collection.delete(where={"user_id": user_id})
+                for collection in (self.collection, self.documents_collection, self.pages_collection):
+                    collection.delete(where={"user_id": user_id})
             else:
                 raise ValueError("Must provide either document_ids or user_id for deletion.")
         except Exception as e:
             raise e
 
+    def delete_sources(self, user_id, sources: List[str]) -> None:
+        """Delete every chunk and summary a user has stored for the given source paths"""
+        if not sources:
+            return
+
+        self.collection.delete(
+            where={"$and": [{"user_id": user_id}, {"source": {"$in": sources}}]}
+        )
+        self._delete_summaries(
+            [self._document_id({"user_id": user_id, "source": source}) for source in sources]
+        )
+
     def get_document_count(self, user_id: str) -> int:
         """Get total number of documents in vector store"""
         # TODO: Return document count
@@ -105,4 +347,242 @@ class VectorStoreService:
             ]
         
         except Exception as e:
-            raise e
\ No newline at end of file
+            raise e
+
+    def _collections(self) -> Dict[str, Any]:
+        return {c.name: c for c in (self.collection, self.documents_collection, self.pages_collection)}
+
+    @staticmethod
+    def _member_names(name: str) -> Tuple[str, str]:
+        return f"{name}.records.jsonl", f"{name}.embeddings.f16"
+
+    @staticmethod
+    def _add_tar_member(tar: tarfile.TarFile, name: str, fileobj: BinaryIO) -> None:
+        info = tarfile.TarInfo(name=name)
+        info.size = fileobj.seek(0, io.SEEK_END)
+        info.mtime = int(datetime.now().timestamp())
+        fileobj.seek(0)
+        tar.addfile(info, fileobj)
+
+    def snapshot(self, fileobj: BinaryIO) -> Dict[str, Any]:
+        """Stream a versioned, checksummed archive of every collection into fileobj.
+
+        The archive is a gzipped tar holding manifest.json followed by, per
+        collection, a JSON lines file of ids/documents/metadatas and a raw
+        little-endian float16 embedding matrix in the same order. Expiring
+        uploads are left out so a replica never keeps them past their expiry.
+
+        The store must be idle while this runs (API server and bulk ingests
+        stopped): collections are read page by page, and a SnapshotError is
+        raised if any collection changed size during the export.
+        """
+        dim = self.model.get_sentence_embedding_dimension()
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "embedding_model": EMBEDDING_MODEL,
+            "collections": {},
+        }
+        # members are spooled first so the manifest with their checksums can lead the stream
+        spooled: List[Tuple[str, BinaryIO]] = []
+
+        try:
+            counts_before = {name: collection.count() for name, collection in self._collections().items()}
+            for name, collection in self._collections().items():
+                records_name, embeddings_name = self._member_names(name)
+                records, embeddings = tempfile.TemporaryFile(), tempfile.TemporaryFile()
+                spooled += [(records_name, records), (embeddings_name, embeddings)]
+                records_hash, embeddings_hash = hashlib.sha256(), hashlib.sha256()
+
+                count = 0
+                while True:
+                    batch = collection.get(
+                        where={"retention": RETENTION_PERSISTENT},
+                        include=["embeddings", "documents", "metadatas"],
+                        limit=settings.snapshot_batch_size,
+                        offset=count,
+                    )
+                    if not batch["ids"]:
+                        break
+                    lines = "".join(
+                        json.dumps({"id": id_, "document": doc, "metadata": meta}) + "\n"
+                        for id_, doc, meta in zip(batch["ids"], batch["documents"], batch["metadatas"])
+                    ).encode()
+                    vectors = np.asarray(batch["embeddings"], dtype="<f2").tobytes()
+
+                    records.write(lines)
+                    records_hash.update(lines)
+                    embeddings.write(vectors)
+                    embeddings_hash.update(vectors)
+                    count += len(batch["ids"])
+                    if len(batch["ids"]) < settings.snapshot_batch_size:
+                        break
+
+                manifest["collections"][name] = {
+                    "count": count,
+                    "dim": dim,
+                    "files": {
+                        records_name: records_hash.hexdigest(),
+                        embeddings_name: embeddings_hash.hexdigest(),
+                    },
+                }
+
+            counts_after = {name: collection.count() for name, collection in self._collections().items()}
+            if counts_after != counts_before:
+                raise SnapshotError("Vector store changed during snapshot, stop all writers and retry")
+
+            with tarfile.open(fileobj=fileobj, mode="w|gz") as tar:
+                self._add_tar_member(tar, "manifest.json", io.BytesIO(json.dumps(manifest, indent=2).encode()))
+                for member_name, member in spooled:
+                    self._add_tar_member(tar, member_name, member)
+
+            return manifest
+        except Exception as e:
+            logger.error(f"Error creating vector store snapshot : {e}")
+            raise e
+        finally:
+            for _, member in spooled:
+                member.close()
+
+    def _check_manifest(self, manifest: Any) -> None:
+        """Validate the manifest before it is used to read any member"""
+        if not isinstance(manifest, dict) or manifest.get("format") != SNAPSHOT_FORMAT:
+            raise SnapshotError("Not a vector store snapshot")
+        if not isinstance(manifest.get("version"), int) or manifest["version"] > SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {manifest.get('version')}")
+        if manifest.get("embedding_model") != EMBEDDING_MODEL:
+            raise SnapshotError(
+                f"Snapshot was embedded with {manifest.get('embedding_model')}, this store uses {EMBEDDING_MODEL}"
+            )
+
+        collections = manifest.get("collections")
+        if not isinstance(collections, dict):
+            raise SnapshotError("Snapshot manifest has no collections")
+
+        known = self._collections()
+        dim = self.model.get_sentence_embedding_dimension()
+        for name, info in collections.items():
+            if name not in known:
+                raise SnapshotError(f"Snapshot contains unknown collection {name}")
+            if (
+                not isinstance(info, dict)
+                or not isinstance(info.get("count"), int) or info["count"] < 0
+                or not isinstance(info.get("dim"), int) or info["dim"] <= 0
+                or not isinstance(info.get("files"), dict)
+            ):
+                raise SnapshotError(f"Invalid manifest entry for collection {name}")
+            if set(info["files"]) != set(self._member_names(name)):
+                raise SnapshotError(f"Manifest for collection {name} lists unexpected files")
+            if info["count"] and info["dim"] != dim:
+                raise SnapshotError(f"Collection {name} has {info['dim']}-d embeddings, model produces {dim}-d")
+
+    def _load_collection(self, name: str, info: Dict[str, Any], records: BinaryIO, embeddings: BinaryIO) -> None:
+        collection = self.db.get_or_create_collection(name=name)
+        row_bytes = info["dim"] * 2
+
+        remaining = info["count"]
+        while remaining:
+            n = min(settings.snapshot_batch_size, remaining)
+            rows = [json.loads(records.readline()) for _ in range(n)]
+            vectors = np.frombuffer(embeddings.read(n * row_bytes), dtype="<f2").reshape(n, info["dim"])
+
+            collection.upsert(
+                ids=[row["id"] for row in rows],
+                documents=[row["document"] for row in rows],
+                metadatas=[row["metadata"] for row in rows],
+                embeddings=vectors.astype(np.float32).tolist(),
+            )
+            remaining -= n
+
+    def _clear_collections(self) -> None:
+        """Drop and recreate every collection, used by restore(replace=True)"""
+        for name in self._collections():
+            self.db.delete_collection(name=name)
+
+        self.collection = self.db.get_or_create_collection(name="chat_db")
+        self.documents_collection = self.db.get_or_create_collection(name="chat_db_documents")
+        self.pages_collection = self.db.get_or_create_collection(name="chat_db_pages")
+
+    def restore(self, fileobj: BinaryIO, replace: bool = False) -> Dict[str, Any]:
+        """Load a snapshot written by snapshot() without re-embedding.
+
+        Every member is checksummed and checked against the manifest's counts
+        before anything is written, then records are upserted in bulk so
+        existing entries with the same ids are replaced. Entries missing from
+        the snapshot are kept unless replace is set, which empties the store
+        first. Like snapshot(), this needs the store to be idle: the API server
+        must be stopped, as it would not see the restored vectors and could
+        overwrite them when it persists its index.
+        """
+        verified: Dict[str, BinaryIO] = {}
+        sizes: Dict[str, int] = {}
+        lines: Dict[str, int] = {}
+
+        try:
+            manifest = None
+            expected: Dict[str, str] = {}
+            with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+                for member in tar:
+                    data = tar.extractfile(member)
+
+                    if manifest is None:
+                        if member.name != "manifest.json":
+                            raise SnapshotError("Snapshot does not start with a manifest")
+                        try:
+                            manifest = json.load(data)
+                        except ValueError as e:
+                            raise SnapshotError(f"Snapshot manifest is not valid JSON: {e}") from e
+                        self._check_manifest(manifest)
+                        expected = {
+                            file: digest
+                            for info in manifest["collections"].values()
+                            for file, digest in info["files"].items()
+                        }
+                        continue
+
+                    if member.name not in expected or member.name in verified:
+                        raise SnapshotError(f"Unexpected snapshot member {member.name}")
+
+                    spool = tempfile.TemporaryFile()
+                    verified[member.name] = spool
+                    digest = hashlib.sha256()
+                    sizes[member.name] = lines[member.name] = 0
+                    while chunk := data.read(1 << 20):
+                        spool.write(chunk)
+                        digest.update(chunk)
+                        sizes[member.name] += len(chunk)
+                        lines[member.name] += chunk.count(b"\n")
+
+                    if digest.hexdigest() != expected[member.name]:
+                        raise SnapshotError(f"Checksum mismatch for {member.name}")
+                    spool.seek(0)
+
+            if manifest is None:
+                raise SnapshotError("Snapshot is empty")
+            missing = set(expected) - set(verified)
+            if missing:
+                raise SnapshotError(f"Snapshot is missing {', '.join(sorted(missing))}")
+
+            # the manifest itself is not checksummed, so its counts must agree with the members
+            for name, info in manifest["collections"].items():
+                records_name, embeddings_name = self._member_names(name)
+                if lines[records_name] != info["count"]:
+                    raise SnapshotError(f"{records_name} has {lines[records_name]} records, manifest says {info['count']}")
+                if sizes[embeddings_name] != info["count"] * info["dim"] * 2:
+                    raise SnapshotError(f"{embeddings_name} size does not match {info['count']} x {info['dim']} float16")
+
+            if replace:
+                self._clear_collections()
+
+            for name, info in manifest["collections"].items():
+                records_name, embeddings_name = self._member_names(name)
+                self._load_collection(name, info, verified[records_name], verified[embeddings_name])
+
+            return manifest
+        except Exception as e:
+            logger.error(f"Error restoring vector store snapshot : {e}")
+            raise e
+        finally:
+            for spool in verified.values():
+                spool.close()
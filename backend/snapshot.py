@@ -0,0 +1,65 @@
+"""Export or import a vector store snapshot to bootstrap a replica.
+
+Stop the API server and any bulk ingests before exporting or importing. The
+export is not point-in-time and fails if the store changes while it runs, and
+a running server would not see imported vectors and could overwrite them when
+it persists its index. Expiring uploads are not included.
+
+An import keeps entries that are not in the snapshot; pass --replace to empty
+the store first when recovering a node.
+
+Run from the backend directory:
+    python snapshot.py export vector_store.snapshot.tar.gz
+    python snapshot.py import vector_store.snapshot.tar.gz --replace
+
+Use "-" as the path to stream through stdout/stdin, e.g.
+    python snapshot.py export - | ssh replica "cd backend && python snapshot.py import -"
+"""
+import argparse
+import logging
+import sys
+import time
+
+from config import settings
+from services.vector_store import VectorStoreService
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Export or import a vector store snapshot",
+        epilog="Both actions require an idle store: stop the API server and bulk ingests first.",
+    )
+    parser.add_argument("action", choices=["export", "import"])
+    parser.add_argument("path", help='Snapshot file, or "-" for stdout/stdin')
+    parser.add_argument(
+        "--replace", action="store_true", help="On import, delete everything in the store before loading"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.log_level)
+
+    vector_store = VectorStoreService()
+    start = time.time()
+
+    if args.action == "export":
+        if args.path == "-":
+            manifest = vector_store.snapshot(sys.stdout.buffer)
+        else:
+            with open(args.path, "wb") as f:
+                manifest = vector_store.snapshot(f)
+    else:
+        if args.path == "-":
+            manifest = vector_store.restore(sys.stdin.buffer, replace=args.replace)
+        else:
+            with open(args.path, "rb") as f:
+                manifest = vector_store.restore(f, replace=args.replace)
+
+    counts = ", ".join(f"{name}: {info['count']}" for name, info in manifest["collections"].items())
+    # stdout may carry the snapshot itself, so report on the log stream
+    logger.info(f"Snapshot {args.action} finished in {time.time() - start:.1f}s ({counts})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from config import settings
+import services.vector_store as vector_store_module
+from services.vector_store import VectorStoreService
+
+
+class FakeEncoder:
+    """Bag-of-words hashing encoder so tests don't download the sentence model"""
+
+    dim = 384
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def encode(self, sentences, **kwargs) -> np.ndarray:
+        vectors = np.zeros((len(sentences), self.dim), dtype=np.float32)
+        for i, text in enumerate(sentences):
+            for word in text.lower().split():
+                vectors[i, int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dim] += 1
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return vectors / norms
+
+
+@pytest.fixture
+def fake_encoder(monkeypatch):
+    monkeypatch.setattr(vector_store_module, "SentenceTransformer", FakeEncoder)
+
+
+@pytest.fixture
+def vector_db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "vector_store")
+    monkeypatch.setattr(settings, "vector_db_path", path)
+    return path
+
+
+@pytest.fixture
+def vector_store(fake_encoder, vector_db_path):
+    return VectorStoreService()
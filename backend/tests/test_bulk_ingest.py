@@ -0,0 +1,89 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from langchain.schema import Document
+
+import bulk_ingest
+from config import settings
+from services.vector_store import VectorStoreService
+
+SAMPLE_PDF = Path(__file__).resolve().parents[2] / "data" / "user_1_sample.pdf"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    directory = tmp_path / "archive"
+    for folder in ("2019", "2020"):
+        (directory / folder).mkdir(parents=True)
+        shutil.copy(SAMPLE_PDF, directory / folder / "statement.pdf")
+    return directory
+
+
+def test_ingest_resumes_after_interruption(archive, tmp_path, vector_store, monkeypatch):
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    monkeypatch.setattr(settings, "ingest_write_batch_size", 1)
+
+    original_add = VectorStoreService.add_documents_bulk
+    calls = {"count": 0}
+
+    def failing_add(self, documents, ids, **kwargs):
+        calls["count"] += 1
+        if calls["count"] == 2:
+            raise RuntimeError("simulated crash")
+        original_add(self, documents, ids, **kwargs)
+
+    monkeypatch.setattr(VectorStoreService, "add_documents_bulk", failing_add)
+    with pytest.raises(RuntimeError):
+        bulk_ingest.ingest_directory(str(archive), workers=1, checkpoint_path=checkpoint_path)
+
+    with open(checkpoint_path) as f:
+        assert len(json.load(f)["completed"]) == 1
+
+    monkeypatch.setattr(VectorStoreService, "add_documents_bulk", original_add)
+    stats = bulk_ingest.ingest_directory(str(archive), workers=1, checkpoint_path=checkpoint_path)
+    assert stats["documents"] == 1
+    assert stats["failed"] == 0
+
+    stats = bulk_ingest.ingest_directory(str(archive), workers=1, checkpoint_path=checkpoint_path)
+    assert stats["documents"] == 0
+
+    stored = VectorStoreService().collection.get(include=["metadatas"])
+    sources = {meta["source"] for meta in stored["metadatas"]}
+    assert sources == {str(p.resolve()) for p in archive.rglob("*.pdf")}
+    assert len(stored["ids"]) == len(set(stored["ids"]))
+
+
+def test_same_archive_ingests_for_each_user(archive, tmp_path, vector_store):
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    first = bulk_ingest.ingest_directory(str(archive), user_id=1, workers=1, checkpoint_path=checkpoint_path)
+    second = bulk_ingest.ingest_directory(str(archive), user_id=2, workers=1, checkpoint_path=checkpoint_path)
+
+    assert first["documents"] == second["documents"] == 2
+    assert first["chunks"] == second["chunks"] > 0
+    store = VectorStoreService()
+    for user_id in (1, 2):
+        assert len(store.collection.get(where={"user_id": user_id})["ids"]) == first["chunks"]
+
+
+def test_reingest_removes_stale_chunks(vector_store):
+    def chunks(count):
+        return [
+            Document(
+                page_content=f"chunk {i}",
+                metadata={"user_id": 1, "source": "/archive/statement.pdf", "filename": "statement.pdf", "page": 0},
+            )
+            for i in range(count)
+        ]
+
+    sources = ["/archive/statement.pdf"]
+    vector_store.add_documents_bulk(chunks(3), bulk_ingest._chunk_ids(1, sources[0], 3), user_id=1, sources=sources)
+    vector_store.add_documents_bulk(chunks(1), bulk_ingest._chunk_ids(1, sources[0], 1), user_id=1, sources=sources)
+    assert vector_store.collection.count() == 1
+
+    # a changed file that no longer yields any text drops everything it had stored
+    vector_store.add_documents_bulk([], [], user_id=1, sources=sources)
+    assert vector_store.collection.count() == 0
+    assert vector_store.documents_collection.count() == 0
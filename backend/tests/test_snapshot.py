@@ -0,0 +1,129 @@
+import io
+import json
+import tarfile
+
+import pytest
+import pytest_asyncio
+from langchain.schema import Document
+
+from config import settings
+from models.schemas import SnapshotError
+from services.vector_store import VectorStoreService
+
+
+def make_chunks(source, texts):
+    return [
+        Document(page_content=text, metadata={"user_id": 1, "source": source, "filename": "statement.pdf", "page": i})
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest_asyncio.fixture
+async def snapshot_bytes(vector_store):
+    chunks = make_chunks("/archive/statement.pdf", ["revenue grew strongly", "operating costs fell", "net profit rose"])
+    vector_store.add_documents_bulk(
+        chunks, [f"chunk-{i}" for i in range(len(chunks))], user_id=1, sources=["/archive/statement.pdf"]
+    )
+    # an expiring upload that must not reach the snapshot
+    vector_store.add_documents(make_chunks("../data/user_1_upload.pdf", ["temporary upload"]), user_id=1)
+
+    buffer = io.BytesIO()
+    vector_store.snapshot(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def replica(tmp_path, fake_encoder, monkeypatch):
+    monkeypatch.setattr(settings, "vector_db_path", str(tmp_path / "replica"))
+    return VectorStoreService()
+
+
+def rewrite_member(data: bytes, name: str, transform) -> bytes:
+    output = io.BytesIO()
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as src, tarfile.open(fileobj=output, mode="w:gz") as dst:
+        for member in src.getmembers():
+            content = src.extractfile(member).read()
+            if member.name == name:
+                content = transform(content)
+            member.size = len(content)
+            dst.addfile(member, io.BytesIO(content))
+    return output.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(snapshot_bytes, replica):
+    manifest = replica.restore(io.BytesIO(snapshot_bytes))
+
+    assert manifest["collections"]["chat_db"]["count"] == 3
+    stored = replica.collection.get(include=["documents", "metadatas"])
+    assert sorted(stored["ids"]) == ["chunk-0", "chunk-1", "chunk-2"]
+    assert all(meta["source"] == "/archive/statement.pdf" for meta in stored["metadatas"])
+    assert replica.documents_collection.count() == 1
+    assert replica.pages_collection.count() == 3
+
+    results = replica.similarity_search(user_id=1, query="net profit", k=1)
+    assert results[0][0].page_content == "net profit rose"
+
+
+@pytest.mark.asyncio
+async def test_restore_rejects_corrupted_member(snapshot_bytes, replica):
+    corrupted = rewrite_member(snapshot_bytes, "chat_db.records.jsonl", lambda content: content.replace(b"revenue", b"REVENUE"))
+
+    with pytest.raises(SnapshotError, match="Checksum mismatch"):
+        replica.restore(io.BytesIO(corrupted))
+    assert replica.collection.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_restore_rejects_other_embedding_model(snapshot_bytes, replica):
+    def swap_model(manifest):
+        manifest["embedding_model"] = "some-other-384d-model"
+
+    with pytest.raises(SnapshotError, match="embedded with"):
+        replica.restore(io.BytesIO(rewrite_member(snapshot_bytes, "manifest.json", edit_manifest(swap_model))))
+
+
+def edit_manifest(edit):
+    def transform(content):
+        manifest = json.loads(content)
+        edit(manifest)
+        return json.dumps(manifest).encode()
+    return transform
+
+
+@pytest.mark.asyncio
+async def test_restore_rejects_manifest_count_mismatch(snapshot_bytes, replica):
+    def inflate_count(manifest):
+        manifest["collections"]["chat_db"]["count"] += 1
+
+    tampered = rewrite_member(snapshot_bytes, "manifest.json", edit_manifest(inflate_count))
+
+    with pytest.raises(SnapshotError, match="records"):
+        replica.restore(io.BytesIO(tampered))
+    assert replica.collection.count() == 0
+    assert replica.documents_collection.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_restore_rejects_unexpected_member_names(snapshot_bytes, replica):
+    def rename_files(manifest):
+        files = manifest["collections"]["chat_db"]["files"]
+        files["chat_db.records.json"] = files.pop("chat_db.records.jsonl")
+
+    tampered = rewrite_member(snapshot_bytes, "manifest.json", edit_manifest(rename_files))
+
+    with pytest.raises(SnapshotError, match="unexpected files"):
+        replica.restore(io.BytesIO(tampered))
+
+
+@pytest.mark.asyncio
+async def test_restore_replace_drops_entries_missing_from_snapshot(snapshot_bytes, replica):
+    stale = [Document(page_content="stale chunk", metadata={"user_id": 1, "source": "/old.pdf", "filename": "old.pdf", "page": 0})]
+    replica.add_documents_bulk(stale, ["stale-0"], user_id=1, sources=["/old.pdf"])
+
+    replica.restore(io.BytesIO(snapshot_bytes))
+    assert "stale-0" in replica.collection.get()["ids"]
+
+    replica.restore(io.BytesIO(snapshot_bytes), replace=True)
+    assert sorted(replica.collection.get()["ids"]) == ["chunk-0", "chunk-1", "chunk-2"]
+    assert replica.documents_collection.count() == 1
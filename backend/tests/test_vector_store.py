@@ -0,0 +1,101 @@
+import pytest
+from langchain.schema import Document
+
+from config import settings
+
+APPLES = "apples orchards harvest apples fruit"
+ROCKETS = "rockets launch orbit fuel engines"
+
+
+def make_chunks(source, texts, user_id=1, page=0):
+    return [
+        Document(
+            page_content=text,
+            metadata={"user_id": user_id, "source": source, "filename": source.rsplit("/", 1)[-1], "page": page},
+        )
+        for text in texts
+    ]
+
+
+def add_bulk(vector_store, chunks, prefix):
+    sources = sorted({doc.metadata["source"] for doc in chunks})
+    vector_store.add_documents_bulk(chunks, [f"{prefix}-{i}" for i in range(len(chunks))], user_id=1, sources=sources)
+
+
+def test_search_is_limited_to_candidate_documents(vector_store, monkeypatch):
+    monkeypatch.setattr(settings, "retrieval_top_documents", 1)
+    add_bulk(vector_store, make_chunks("/archive/fruit.pdf", [APPLES, "apples and pears"]), "fruit")
+    add_bulk(vector_store, make_chunks("/archive/space.pdf", [ROCKETS, "rockets and moons"]), "space")
+
+    results = vector_store.similarity_search(user_id=1, query="apples harvest", k=4)
+
+    assert results
+    assert {doc.metadata["source"] for doc, _ in results} == {"/archive/fruit.pdf"}
+
+
+def test_search_ranks_candidates_past_the_hnsw_buffer(vector_store, monkeypatch):
+    # more chunks than chroma's default hnsw:batch_size (100), so they live in the HNSW index
+    monkeypatch.setattr(settings, "retrieval_top_documents", 1)
+    noise = [
+        chunk
+        for d in range(30)
+        for chunk in make_chunks(f"/archive/noise-{d}.pdf", [f"ledger{d} entry{c} balance{d}{c}" for c in range(5)])
+    ]
+    add_bulk(vector_store, noise, "noise")
+    add_bulk(vector_store, make_chunks("/archive/space.pdf", [ROCKETS, "rockets and moons", "rockets orbit"]), "space")
+    assert vector_store.collection.count() > 100
+
+    results = vector_store.similarity_search(user_id=1, query="rockets orbit launch", k=3)
+
+    assert len(results) == 3
+    assert {doc.metadata["source"] for doc, _ in results} == {"/archive/space.pdf"}
+    scores = [score for _, score in results]
+    assert scores == sorted(scores)
+
+
+def test_same_filename_in_different_folders_are_separate_documents(vector_store):
+    add_bulk(
+        vector_store,
+        make_chunks("/archive/2019/statement.pdf", [APPLES]) + make_chunks("/archive/2020/statement.pdf", [ROCKETS]),
+        "statements",
+    )
+
+    assert vector_store.documents_collection.count() == 2
+    assert vector_store.pages_collection.count() == 2
+    results = vector_store.similarity_search(user_id=1, query="rockets orbit", k=1)
+    assert results[0][0].metadata["source"] == "/archive/2020/statement.pdf"
+
+
+def test_backfill_makes_legacy_chunks_searchable(vector_store):
+    # chunk stored before summaries existed: no doc_id or page_key metadata
+    vector_store.collection.add(
+        ids=["legacy-0"],
+        documents=[ROCKETS],
+        embeddings=vector_store.model.encode([ROCKETS]).tolist(),
+        metadatas=[{"user_id": 1, "source": "../data/user_1_old.pdf", "filename": "user_1_old.pdf", "page": 0}],
+    )
+    add_bulk(vector_store, make_chunks("/archive/fruit.pdf", [APPLES]), "fruit")
+
+    assert vector_store.backfill_summaries() == 1
+    assert vector_store.backfill_summaries() == 0
+
+    results = vector_store.similarity_search(user_id=1, query="rockets launch", k=1)
+    assert results[0][0].page_content == ROCKETS
+
+
+@pytest.mark.asyncio
+async def test_expiring_an_earlier_upload_keeps_shared_summaries(vector_store):
+    chunks = make_chunks("../data/user_1_report.pdf", [ROCKETS])
+
+    vector_store.add_documents(chunks, user_id=1)
+    first_upload = vector_store.collection.get()["ids"]
+    vector_store.add_documents(chunks, user_id=1)
+    second_upload = [id_ for id_ in vector_store.collection.get()["ids"] if id_ not in first_upload]
+
+    vector_store.delete_documents(document_ids=first_upload, user_id=1)
+    assert vector_store.documents_collection.count() == 1
+    assert vector_store.similarity_search(user_id=1, query="rockets", k=1)
+
+    vector_store.delete_documents(document_ids=second_upload, user_id=1)
+    assert vector_store.documents_collection.count() == 0
+    assert vector_store.pages_collection.count() == 0